@@ -1,11 +1,58 @@
 import pandas as pd
+import numpy as np
+import io
 import os
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional, Union
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Sequence, Union
 from pathlib import Path
 import chardet
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import python_calamine  # noqa: F401
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+PANDAS_2 = int(pd.__version__.split('.')[0]) >= 2
+
+# The multithreaded pyarrow CSV parser and Arrow-backed dtypes need pandas 2.x
+USE_PYARROW_ENGINE = PYARROW_AVAILABLE and PANDAS_2
+
+# pandas added the calamine Excel engine in 2.2
+USE_CALAMINE_ENGINE = CALAMINE_AVAILABLE and tuple(map(int, pd.__version__.split('.')[:2])) >= (2, 2)
+
+# Microsecond resolution keeps far-future placeholder dates such as 9999-12-31
+# representable; pandas 1.x only supports nanoseconds
+DATETIME_DTYPE = 'datetime64[us]' if PANDAS_2 else 'datetime64[ns]'
+
+# pandas 2 only infers the format of each value separately with format='mixed';
+# pandas 1.x does so when no format is given and rejects 'mixed'
+MIXED_DATETIME_KWARGS = {'format': 'mixed'} if PANDAS_2 else {}
+
+# Whole years that fit in DATETIME_DTYPE, as checked by the Numba date kernel
+MIN_DATE_YEAR, MAX_DATE_YEAR = (1, 9999) if PANDAS_2 else (1678, 2261)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -82,8 +129,58 @@ class CSVCleaner:
         "planloadst", "plan_g_i_do_"
     ]
     
+    DATE_FORMATS = [
+        '%Y-%m-%d',     # YYYY-MM-DD
+        '%m/%d/%Y',     # MM/DD/YYYY
+        '%d/%m/%Y',     # DD/MM/YYYY
+        '%Y/%m/%d',     # YYYY/MM/DD
+        '%m-%d-%Y',     # MM-DD-YYYY
+        '%d-%m-%Y',     # DD-MM-YYYY
+        '%Y-%m-%d %H:%M:%S',  # Date cells read from Excel workbooks
+    ]
+    
+    LOW_CARDINALITY_COLUMNS = [
+        "carrier_name", "shipping_point", "customer_state", "we_country",
+        "division", "qty_unit", "vol_unit", "wgt_unit", "delivery_type",
+        "record_type", "shty", "cust_grp"
+    ]
+    
+    # Zero-padded 10-character formats the Numba kernel can parse, given as
+    # byte offsets of (year, month, day, first separator, second separator)
+    # followed by the separator byte
+    FIXED_WIDTH_DATE_LAYOUTS = {
+        '%Y-%m-%d': (0, 5, 8, 4, 7, ord('-')),
+        '%Y/%m/%d': (0, 5, 8, 4, 7, ord('/')),
+        '%m/%d/%Y': (6, 0, 3, 2, 5, ord('/')),
+        '%m-%d-%Y': (6, 0, 3, 2, 5, ord('-')),
+        '%d/%m/%Y': (6, 3, 0, 2, 5, ord('/')),
+        '%d-%m-%Y': (6, 3, 0, 2, 5, ord('-')),
+    }
+    
+    # Number of non-empty values sampled to rank DATE_FORMATS per column
+    DATE_SAMPLE_SIZE = 100
+    
+    # Rows searched for that sample when a file is streamed in chunks
+    DATE_SCAN_ROWS = 10000
+    
     COLUMNS_TO_DROP = ['Status']
     
+    EXCEL_SUFFIXES = ('.xls', '.xlsx', '.xlsm')
+    FILE_PATTERNS = ('*.csv', '*.xls', '*.xlsx', '*.xlsm')
+    
+    _MAPPING_KEYS = frozenset(COLUMN_MAPPING)
+    _DROP_SET = frozenset(COLUMNS_TO_DROP)
+    _ALL_KNOWN = _MAPPING_KEYS | _DROP_SET
+    
+    # Checked in order, so UTF-32 comes before the UTF-16 BOM it starts with
+    BYTE_ORDER_MARKS = [
+        (b'\xef\xbb\xbf', 'utf-8-sig'),
+        (b'\xff\xfe\x00\x00', 'utf-32'),
+        (b'\x00\x00\xfe\xff', 'utf-32'),
+        (b'\xff\xfe', 'utf-16'),
+        (b'\xfe\xff', 'utf-16'),
+    ]
+    
     def __init__(self, chunk_size: Optional[int] = None):
         """
         Initialize the CSV cleaner.
@@ -111,22 +208,69 @@ class CSVCleaner:
         try:
             with open(file_path, 'rb') as f:
                 raw_data = f.read(10000)  # Read first 10KB
-                result = chardet.detect(raw_data)
-                encoding = result['encoding']
-                confidence = result['confidence']
-                
-                logger.info(f"Detected encoding: {encoding} (confidence: {confidence:.2f})")
-                return encoding or 'utf-8'
+            return self.detect_encoding_from_bytes(raw_data)
         except Exception as e:
             logger.warning(f"Failed to detect encoding for {file_path}: {e}")
             return 'utf-8'
     
-    def read_csv_with_fallback(self, file_path: Union[str, Path]) -> pd.DataFrame:
+    def detect_encoding_from_bytes(self, raw_data: bytes) -> str:
+        """
+        Detect the encoding of a sample of raw CSV bytes.
+        
+        A byte order mark or a sample that decodes as UTF-8 settles the
+        encoding immediately; chardet only runs for anything else.
+        
+        Args:
+            raw_data: Leading bytes of the file
+            
+        Returns:
+            Detected encoding string
+        """
+        for bom, encoding in self.BYTE_ORDER_MARKS:
+            if raw_data.startswith(bom):
+                logger.info(f"Detected encoding from byte order mark: {encoding}")
+                return encoding
+        
+        try:
+            raw_data.decode('utf-8')
+            logger.info("Detected encoding: utf-8")
+            return 'utf-8'
+        except UnicodeDecodeError as e:
+            # A multi-byte character cut off by the sample is still UTF-8
+            if e.reason == 'unexpected end of data':
+                logger.info("Detected encoding: utf-8")
+                return 'utf-8'
+        
+        result = chardet.detect(raw_data)
+        encoding = result['encoding']
+        confidence = result['confidence']
+        
+        logger.info(f"Detected encoding: {encoding} (confidence: {confidence:.2f})")
+        return encoding or 'utf-8'
+    
+    def encoding_candidates(self, detected: str) -> List[str]:
+        """
+        List the encodings to try, the detected one first.
+        
+        Args:
+            detected: Encoding reported by encoding detection
+            
+        Returns:
+            Encodings in the order they should be attempted
+        """
+        return list(dict.fromkeys([detected, 'utf-8', 'latin1', 'cp1252']))
+    
+    def read_csv_with_fallback(self, file_path: Union[str, Path], encoding: Optional[str] = None) -> pd.DataFrame:
         """
         Read CSV file with encoding fallback and error handling.
         
+        The file is read from disk once and each encoding attempt parses
+        the same in-memory buffer.
+        
         Args:
             file_path: Path to the CSV file
+            encoding: Encoding already detected for the file; detected from
+                the file contents when omitted
             
         Returns:
             DataFrame with the CSV data
@@ -134,11 +278,15 @@ class CSVCleaner:
         Raises:
             Exception: If all encoding attempts fail
         """
-        encodings = [self.detect_encoding(file_path), 'utf-8', 'latin1', 'cp1252']
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        source = io.BytesIO(data)
         
-        for encoding in encodings:
+        detected = encoding or self.detect_encoding_from_bytes(data[:10000])
+        for encoding in self.encoding_candidates(detected):
             try:
                 logger.info(f"Attempting to read {file_path} with encoding: {encoding}")
+                source.seek(0)
                 
                 read_kwargs = {
                     'dtype': str, 
@@ -146,10 +294,18 @@ class CSVCleaner:
                     'na_filter': False  # Prevent pandas from converting empty strings to NaN
                 }
                 
-                if self.chunk_size:
-                    read_kwargs['chunksize'] = self.chunk_size
+                if USE_PYARROW_ENGINE:
+                    read_kwargs.update({
+                        'dtype': 'string[pyarrow]',
+                        'engine': 'pyarrow',
+                        'dtype_backend': 'pyarrow',
+                        # The pyarrow engine ignores na_filter, so switch off its
+                        # NA/NULL/N/A/nan detection explicitly
+                        'keep_default_na': False,
+                        'na_values': []
+                    })
                 
-                df = pd.read_csv(file_path, **read_kwargs)
+                df = pd.read_csv(source, **read_kwargs)
                 logger.info(f"Successfully read {file_path} with {encoding}")
                 return df
                 
@@ -162,26 +318,48 @@ class CSVCleaner:
         
         raise Exception(f"Failed to read {file_path} with any encoding")
     
-    def clean_column_names(self, df: pd.DataFrame) -> pd.DataFrame:
+    def read_excel_with_calamine(self, file_path: Union[str, Path]) -> pd.DataFrame:
+        """
+        Read the first sheet of an Excel workbook with the Rust-based calamine engine.
+        
+        Falls back to pandas' default Excel engine (openpyxl/xlrd) when
+        python-calamine is not installed or pandas is older than 2.2.
+        
+        Args:
+            file_path: Path to the Excel file
+            
+        Returns:
+            DataFrame with the sheet data
+        """
+        if USE_CALAMINE_ENGINE:
+            logger.info(f"Reading {file_path} with calamine")
+            return pd.read_excel(file_path, engine='calamine', dtype=str, na_filter=False)
+        
+        logger.info(f"Reading {file_path} with the default Excel engine")
+        return pd.read_excel(file_path, dtype=str, na_filter=False)
+    
+    def clean_column_names(self, df: pd.DataFrame, warn_unknown: bool = True) -> pd.DataFrame:
         """
         Clean and standardize column names.
         
         Args:
             df: Input DataFrame
+            warn_unknown: Whether to log columns missing from COLUMN_MAPPING
             
         Returns:
             DataFrame with cleaned column names
         """
-        # Remove columns with null/empty names
-        df = df.loc[:, df.columns.notnull() & (df.columns != '')]
-        
-        # Strip whitespace from column names
-        df.columns = df.columns.str.strip()
+        # Strip whitespace from column names and remove null/empty ones
+        cols = df.columns.str.strip()
+        mask = cols.notna() & (cols != '')
+        df = df.loc[:, mask]
+        df.columns = cols[mask]
         
         # Log unknown columns
-        unknown_cols = [col for col in df.columns if col not in self.COLUMN_MAPPING and col not in self.COLUMNS_TO_DROP]
-        if unknown_cols:
-            logger.warning(f"Unknown columns found: {unknown_cols}")
+        if warn_unknown:
+            unknown_cols = df.columns.difference(self._ALL_KNOWN, sort=False).tolist()
+            if unknown_cols:
+                logger.warning(f"Unknown columns found: {unknown_cols}")
         
         return df
     
@@ -195,18 +373,11 @@ class CSVCleaner:
         Returns:
             DataFrame with filtered and renamed columns
         """
-        # Keep only columns that are in our mapping
-        valid_cols = [col for col in df.columns if col in self.COLUMN_MAPPING]
-        df = df[valid_cols]
-        
-        # Drop specified columns
-        for col in self.COLUMNS_TO_DROP:
-            if col in df.columns:
-                df = df.drop(columns=[col])
-                logger.info(f"Dropped column: {col}")
+        # Keep only mapped columns that are not marked for dropping
+        keep = df.columns.intersection(self._MAPPING_KEYS).difference(self._DROP_SET, sort=False)
         
         # Rename columns
-        df = df.rename(columns=self.COLUMN_MAPPING)
+        df = df[keep].rename(columns=self.COLUMN_MAPPING)
         
         return df
     
@@ -220,60 +391,131 @@ class CSVCleaner:
         Returns:
             DataFrame with cleaned string data
         """
-        for col in df.columns:
-            if df[col].dtype == object:
-                df[col] = df[col].astype(str).str.strip()
-                # Convert 'nan' strings back to empty strings
-                df[col] = df[col].replace('nan', '')
+        # Columns are already read as strings and missing values pass through
+        # str.strip untouched, so strip is the only pass needed
+        str_cols = df.select_dtypes(include=['object', 'string']).columns
+        df[str_cols] = df[str_cols].apply(lambda s: s.str.strip())
         
         return df
     
-    def parse_date_flexible(self, date_str: str) -> str:
+    def convert_low_cardinality_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Parse date string with multiple format attempts.
+        Store columns with few distinct values as categoricals.
         
         Args:
-            date_str: Date string to parse
+            df: Input DataFrame
             
         Returns:
-            Formatted date string (YYYY-MM-DD) or empty string if parsing fails
-        """
-        if pd.isnull(date_str) or date_str == '' or date_str == 'nan':
-            return ''
-        
-        # Try multiple date formats
-        date_formats = [
-            '%Y-%m-%d',     # YYYY-MM-DD
-            '%m/%d/%Y',     # MM/DD/YYYY
-            '%d/%m/%Y',     # DD/MM/YYYY
-            '%Y/%m/%d',     # YYYY/MM/DD
-            '%m-%d-%Y',     # MM-DD-YYYY
-            '%d-%m-%Y',     # DD-MM-YYYY
-        ]
-        
-        for fmt in date_formats:
-            try:
-                dt = datetime.strptime(str(date_str).strip(), fmt)
-                return dt.strftime('%Y-%m-%d')
-            except ValueError:
-                continue
+            DataFrame with low-cardinality columns converted to category dtype
+        """
+        for col in self.LOW_CARDINALITY_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        
+        return df
+    
+    def rank_date_formats(self, values: pd.Series) -> List[str]:
+        """
+        Order DATE_FORMATS by how many sampled values each one parses.
+        
+        Exports almost always use one format per column, so trying the
+        winning format first usually parses the whole column in one pass.
+        
+        Args:
+            values: Non-empty date strings from a single column
+            
+        Returns:
+            DATE_FORMATS sorted from most to least matching
+        """
+        sample = values.head(self.DATE_SAMPLE_SIZE)
+        matches = {
+            fmt: pd.to_datetime(sample, format=fmt, errors='coerce').notna().sum()
+            for fmt in self.DATE_FORMATS
+        }
+        return sorted(self.DATE_FORMATS, key=lambda fmt: matches[fmt], reverse=True)
+    
+    def rank_file_date_formats(self, input_path: Union[str, Path], encoding: str) -> Dict[str, List[str]]:
+        """
+        Rank date formats per column from the first values of a CSV file.
+        
+        Streaming ranks from the same sample a whole-file read would use, so
+        ambiguous dates such as 1/5/2024 do not depend on chunk_size. Only
+        the date columns of the first DATE_SCAN_ROWS rows are read, which
+        keeps this cheap when a date column is sparse or empty.
+        
+        Args:
+            input_path: Path to input CSV file
+            encoding: Encoding to read the file with
+            
+        Returns:
+            Ranked DATE_FORMATS for each date column that has values
+        """
+        def is_date_column(name: str) -> bool:
+            key = name.strip()
+            return key not in self._DROP_SET and self.COLUMN_MAPPING.get(key) in self.DATE_COLUMNS
+        
+        head = pd.read_csv(input_path, dtype=str, encoding=encoding, na_filter=False,
+                           usecols=is_date_column, nrows=self.DATE_SCAN_ROWS)
+        head.columns = head.columns.str.strip()
+        head = self.filter_and_rename_columns(head)
+        
+        formats = {}
+        for col in head.columns:
+            values = head[col].str.strip()
+            values = values[values != '']
+            if len(values):
+                formats[col] = self.rank_date_formats(values)
+        
+        return formats
+    
+    def parse_dates(self, values: pd.Series, fmt: str) -> pd.Series:
+        """
+        Parse date strings that share a single format.
+        
+        Zero-padded formats are parsed by a compiled Numba kernel when Numba
+        is installed; anything the kernel rejects, such as unpadded values,
+        is handed to pd.to_datetime with the same format.
+        
+        Args:
+            values: Non-empty date strings
+            fmt: strptime format to parse with
+            
+        Returns:
+            Series of datetimes, NaT where parsing fails
+        """
+        layout = self.FIXED_WIDTH_DATE_LAYOUTS.get(fmt)
+        if not NUMBA_AVAILABLE or layout is None:
+            return pd.to_datetime(values, format=fmt, errors='coerce')
         
-        # If manual parsing fails, try pandas
         try:
-            dt = pd.to_datetime(date_str, errors='coerce', dayfirst=False)
-            if pd.isnull(dt):
-                return ''
-            return dt.strftime('%Y-%m-%d')
-        except:
-            logger.warning(f"Failed to parse date: {date_str}")
-            return ''
+            raw = values.where(values.str.len() == 10, '').to_numpy(dtype='S10')
+        except UnicodeEncodeError:
+            return pd.to_datetime(values, format=fmt, errors='coerce')
+        
+        rows = np.frombuffer(raw.tobytes(), dtype=np.uint8).reshape(-1, 10)
+        days = np.empty(len(rows), dtype=np.int64)
+        _parse_fixed_width_dates(rows, *layout, MIN_DATE_YEAR, MAX_DATE_YEAR, days)
+        parsed = pd.Series(days.view('datetime64[D]').astype(DATETIME_DTYPE), index=values.index)
+        
+        missed = parsed.isna().to_numpy()
+        if missed.any():
+            parsed.loc[missed] = pd.to_datetime(values[missed], format=fmt, errors='coerce')
+        
+        return parsed
     
-    def process_date_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+    def process_date_columns(self, df: pd.DataFrame,
+                             date_formats: Optional[Dict[str, List[str]]] = None) -> pd.DataFrame:
         """
         Process and format date columns.
         
+        Each column is parsed with one vectorized pd.to_datetime call per
+        date format, most likely format first, only retrying rows that
+        earlier formats could not parse.
+        
         Args:
             df: Input DataFrame
+            date_formats: Optional ranked formats per column, used instead of
+                ranking this DataFrame's own values
             
         Returns:
             DataFrame with processed date columns
@@ -281,14 +523,70 @@ class CSVCleaner:
         for col in self.DATE_COLUMNS:
             if col in df.columns:
                 logger.info(f"Processing date column: {col}")
-                df[col] = df[col].apply(self.parse_date_flexible)
+                values = df[col]
+                result = pd.Series(pd.NaT, index=df.index, dtype=DATETIME_DTYPE)
+                unparsed = (values.fillna('') != '').to_numpy(dtype=bool)
+                
+                if date_formats is not None and col in date_formats:
+                    formats = date_formats[col]
+                else:
+                    formats = self.rank_date_formats(values[unparsed])
+                
+                for fmt in formats:
+                    if not unparsed.any():
+                        break
+                    result.loc[unparsed] = self.parse_dates(values[unparsed], fmt)
+                    unparsed = unparsed & result.isna().to_numpy()
+                
+                # Let pandas infer anything the explicit formats missed
+                if unparsed.any():
+                    result.loc[unparsed] = self.infer_dates(values[unparsed])
+                
+                df[col] = result.dt.strftime('%Y-%m-%d').fillna('')
         
         return df
     
+    def infer_dates(self, values: pd.Series) -> pd.Series:
+        """
+        Parse date strings that match none of DATE_FORMATS, inferring the
+        format of each value separately.
+        
+        Args:
+            values: Non-empty date strings
+            
+        Returns:
+            Series of datetimes, NaT where parsing fails
+        """
+        return pd.to_datetime(values, errors='coerce', **MIXED_DATETIME_KWARGS)
+    
+    def numeric_from_arrow(self, values: pd.Series) -> pd.Series:
+        """
+        Convert an Arrow-backed string column to float64 with Arrow compute kernels.
+        
+        Args:
+            values: Arrow-backed string Series
+            
+        Returns:
+            Arrow-backed float64 Series, null where the input was empty or NaN
+            
+        Raises:
+            pyarrow.ArrowInvalid: If a non-empty value is not a number
+        """
+        arr = pc.utf8_trim_whitespace(pc.replace_substring(pa.array(values), ",", ""))
+        arr = pc.if_else(pc.equal(arr, ""), None, arr)
+        numbers = pc.cast(arr, pa.float64())
+        # Arrow keeps "nan" as a float NaN rather than a null, unlike pd.to_numeric
+        numbers = pc.if_else(pc.is_nan(numbers), None, numbers)
+        return pd.Series(numbers, dtype=pd.ArrowDtype(pa.float64()), index=values.index)
+    
     def process_numeric_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Process and clean numeric columns.
         
+        Arrow-backed columns are converted without leaving Arrow; other
+        columns, or Arrow columns holding non-numeric text, go through
+        pd.to_numeric.
+        
         Args:
             df: Input DataFrame
             
@@ -298,10 +596,19 @@ class CSVCleaner:
         for col in self.NUMERIC_COLUMNS:
             if col in df.columns:
                 logger.info(f"Processing numeric column: {col}")
-                # Clean the data: remove commas, strip spaces, handle empty strings
-                df[col] = df[col].astype(str).str.replace(",", "", regex=False).str.strip()
-                df[col] = df[col].replace('', None)  # Convert empty strings to None
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+                
+                if PYARROW_AVAILABLE and hasattr(df[col].array, '__arrow_array__'):
+                    try:
+                        df[col] = self.numeric_from_arrow(df[col])
+                        continue
+                    except pa.ArrowInvalid:
+                        # Arrow can't coerce bad values to null; let pandas do it
+                        pass
+                
+                # Remove thousands separators; to_numeric tolerates surrounding
+                # whitespace, and empty strings are masked out to become NaN
+                values = df[col].str.replace(",", "", regex=False)
+                df[col] = pd.to_numeric(values.where(values.str.len() > 0), errors='coerce')
         
         return df
     
@@ -312,31 +619,168 @@ class CSVCleaner:
         Args:
             df: DataFrame to validate
             
+        Returns:
+            Dictionary with validation results
+        """
+        nulls = df.isnull()
+        return self._validation_results(len(df), nulls.all(axis=1).sum(), nulls.sum())
+    
+    def _validation_results(self, total: int, empty_rows: int, null_counts: pd.Series) -> Dict[str, Union[int, List[str]]]:
+        """
+        Build the validation results from row and null counts.
+        
+        Args:
+            total: Number of rows
+            empty_rows: Number of rows where every column is null
+            null_counts: Number of nulls per column
+            
         Returns:
             Dictionary with validation results
         """
         validation_results = {
-            'total_rows': len(df),
-            'empty_rows': df.isnull().all(axis=1).sum(),
+            'total_rows': total,
+            'empty_rows': empty_rows,
             'columns_with_nulls': [],
             'date_parsing_issues': [],
             'numeric_conversion_issues': []
         }
         
         # Check for columns with high null percentages
-        for col in df.columns:
-            null_pct = (df[col].isnull().sum() / len(df)) * 100
-            if null_pct > 50:  # More than 50% nulls
-                validation_results['columns_with_nulls'].append(f"{col}: {null_pct:.1f}%")
+        null_pcts = null_counts / total * 100
+        high_null = null_pcts[null_pcts > 50]  # More than 50% nulls
+        validation_results['columns_with_nulls'] = [f"{col}: {pct:.1f}%" for col, pct in high_null.items()]
         
         return validation_results
     
+    def format_numeric_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Render numeric columns as text for output.
+        
+        Whole numbers are written as integers, so long ids never come out
+        in scientific notation or with a trailing '.0', and NaN/inf become
+        empty fields. Every writer then produces identical numbers.
+        
+        Args:
+            df: Cleaned DataFrame
+            
+        Returns:
+            DataFrame with numeric columns converted to strings
+        """
+        formatted = {}
+        for col in self.NUMERIC_COLUMNS:
+            if col in df.columns:
+                values = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+                formatted[col] = self.format_numbers(values)
+        
+        return df.assign(**formatted)
+    
+    def format_numbers(self, values: np.ndarray) -> np.ndarray:
+        """
+        Render float64 values as CSV text, shared by every output path.
+        
+        Args:
+            values: float64 array, NaN where a value is missing
+            
+        Returns:
+            Object array of strings, None for NaN and inf
+        """
+        with np.errstate(invalid='ignore'):
+            finite = np.isfinite(values)
+            integral = finite & (np.mod(values, 1) == 0) & (np.abs(values) < 2**63)
+        fractional = finite & ~integral
+        
+        out = np.full(len(values), None, dtype=object)
+        out[integral] = values[integral].astype(np.int64).astype(str)
+        out[fractional] = values[fractional].astype(str)
+        return out
+    
+    def needs_quoting(self, df: pd.DataFrame) -> bool:
+        """
+        Check whether any text field contains a delimiter, quote or newline.
+        
+        Args:
+            df: DataFrame about to be written
+            
+        Returns:
+            True if some field has to be quoted in CSV output
+        """
+        for col in df.select_dtypes(include=['object', 'string', 'category']).columns:
+            # Numeric and date columns are rendered without such characters
+            if col in self.NUMERIC_COLUMNS or col in self.DATE_COLUMNS:
+                continue
+            values = df[col]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                values = values.cat.categories.to_series()
+            if values.str.contains(r'[,"\r\n]', regex=True, na=False).any():
+                return True
+        
+        return False
+    
+    def write_csv(self, df: pd.DataFrame, output_path: Union[str, Path], append: bool = False) -> None:
+        """
+        Write a cleaned DataFrame to CSV, using the multithreaded pyarrow
+        writer when it is available.
+        
+        Output is the same whichever writer runs: an unquoted header, fields
+        quoted only when they contain a delimiter, quote or newline, empty
+        fields for nulls and LF line endings. pyarrow can't quote selectively,
+        so frames with such fields are written by pandas.
+        
+        Args:
+            df: Cleaned DataFrame
+            output_path: Path to output CSV file
+            append: Append to an existing file without writing the header
+        """
+        df = self.format_numeric_columns(df)
+        
+        if PYARROW_AVAILABLE and not self.needs_quoting(df):
+            write_options = pacsv.WriteOptions(include_header=False, quoting_style='none')
+            with open(output_path, 'ab' if append else 'wb') as f:
+                if not append:
+                    # Mapped column names never need quoting
+                    f.write((','.join(df.columns) + '\n').encode('utf-8'))
+                # Written batch by batch straight into the file
+                pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), f, write_options=write_options)
+            return
+        
+        df.to_csv(output_path, index=False, na_rep='', lineterminator='\n',
+                  mode='a' if append else 'w', header=not append)
+    
+    def clean_dataframe(self, df: pd.DataFrame,
+                        date_formats: Optional[Dict[str, List[str]]] = None,
+                        warn_unknown: bool = True) -> pd.DataFrame:
+        """
+        Run the full cleaning pipeline on a DataFrame.
+        
+        Args:
+            df: Raw DataFrame as read from the CSV
+            date_formats: Optional ranked date formats per column, shared by
+                the chunks of one file
+            warn_unknown: Whether to log columns missing from COLUMN_MAPPING
+            
+        Returns:
+            Cleaned DataFrame
+        """
+        df = self.clean_column_names(df, warn_unknown)
+        df = self.filter_and_rename_columns(df)
+        df = self.clean_string_data(df)
+        df = self.convert_low_cardinality_columns(df)
+        df = self.process_date_columns(df, date_formats)
+        df = self.process_numeric_columns(df)
+        
+        return df
+    
     def clean_csv(self, input_path: Union[str, Path], output_path: Union[str, Path]) -> bool:
         """
-        Clean a single CSV file.
+        Clean a single CSV or Excel file.
+        
+        When chunk_size is set CSV files are streamed chunk by chunk, so
+        memory use is bounded by the chunk size rather than the file size.
+        Otherwise UTF-8 CSV files go through a single lazy Polars query
+        when Polars is installed.
         
         Args:
-            input_path: Path to input CSV file
+            input_path: Path to input CSV or Excel file
             output_path: Path to output cleaned CSV file
             
         Returns:
@@ -345,8 +789,41 @@ class CSVCleaner:
         try:
             logger.info(f"Starting to clean: {input_path}")
             
-            # Read CSV with fallback encoding
-            df = self.read_csv_with_fallback(input_path)
+            # Ensure output directory exists
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            
+            is_excel = Path(input_path).suffix.lower() in self.EXCEL_SUFFIXES
+            
+            # Streaming paths write the output themselves and return the row
+            # count, or None to hand the file to the pandas path
+            rows_written = None
+            encoding = None
+            if not is_excel:
+                if self.chunk_size:
+                    rows_written = self._clean_csv_chunked(input_path, output_path)
+                elif POLARS_AVAILABLE:
+                    encoding = self.detect_encoding(input_path)
+                    if encoding in ('utf-8', 'utf-8-sig'):
+                        rows_written = self._clean_csv_polars(input_path, output_path)
+            
+            if rows_written is not None:
+                if not rows_written:
+                    logger.warning(f"Empty DataFrame for {input_path}")
+                    return False
+                
+                logger.info(f"Cleaned CSV written to {output_path}")
+                logger.info(f"Rows written: {rows_written}")
+                
+                self.stats['files_processed'] += 1
+                self.stats['rows_processed'] += rows_written
+                
+                return True
+            
+            if is_excel:
+                df = self.read_excel_with_calamine(input_path)
+            else:
+                # Read CSV with fallback encoding
+                df = self.read_csv_with_fallback(input_path, encoding)
             
             if df.empty:
                 logger.warning(f"Empty DataFrame for {input_path}")
@@ -356,21 +833,14 @@ class CSVCleaner:
             logger.info(f"Original shape: {original_shape}")
             
             # Processing pipeline
-            df = self.clean_column_names(df)
-            df = self.filter_and_rename_columns(df)
-            df = self.clean_string_data(df)
-            df = self.process_date_columns(df)
-            df = self.process_numeric_columns(df)
+            df = self.clean_dataframe(df)
             
             # Validate results
             validation = self.validate_data(df)
             logger.info(f"Validation results: {validation}")
             
-            # Ensure output directory exists
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            
             # Write cleaned CSV
-            df.to_csv(output_path, index=False, na_rep='')
+            self.write_csv(df, output_path)
             
             final_shape = df.shape
             logger.info(f"Cleaned CSV written to {output_path}")
@@ -388,15 +858,228 @@ class CSVCleaner:
             self.stats['errors'].append(error_msg)
             return False
     
+    def _clean_csv_polars(self, input_path: Union[str, Path], output_path: Union[str, Path]) -> Optional[int]:
+        """
+        Clean a UTF-8 CSV file as one lazy Polars query.
+        
+        Renaming, stripping, date parsing and numeric conversion are built
+        into a single expression graph, which Polars fuses into one
+        streaming scan of the input when the output is sunk.
+        
+        Args:
+            input_path: Path to input CSV file
+            output_path: Path to output cleaned CSV file
+            
+        Returns:
+            Number of rows written, or None if the file should be cleaned by
+            the pandas path instead
+        """
+        try:
+            # Read every column as a string, like dtype=str in the pandas path
+            lf = pl.scan_csv(input_path, infer_schema_length=0)
+            
+            renames = {}
+            unknown_cols = []
+            for name in lf.collect_schema().names():
+                key = name.strip()
+                if not key:
+                    continue
+                if key not in self._ALL_KNOWN:
+                    unknown_cols.append(key)
+                elif key not in self._DROP_SET:
+                    renames[name] = self.COLUMN_MAPPING[key]
+            
+            # The pandas path still writes a file when no column is mapped
+            if not renames:
+                return None
+            
+            if unknown_cols:
+                logger.warning(f"Unknown columns found: {unknown_cols}")
+            
+            lf = lf.select([pl.col(src).alias(dst) for src, dst in renames.items()])
+            lf = lf.with_columns(pl.col(pl.Utf8).str.strip_chars())
+            
+            date_exprs = []
+            for col in self.DATE_COLUMNS:
+                if col in renames.values():
+                    sample = lf.select(col).drop_nulls().head(self.DATE_SAMPLE_SIZE).collect().to_series()
+                    formats = self.rank_date_formats(pd.Series(sample.to_list(), dtype=object))
+                    parsed = pl.coalesce([pl.col(col).str.strptime(pl.Datetime, fmt, strict=False) for fmt in formats])
+                    # Values no format matched go through the pandas fallback
+                    unmatched = pl.when(parsed.is_null() & (pl.col(col) != '')).then(pl.col(col))
+                    date_exprs.append(pl.coalesce([
+                        parsed.dt.strftime('%Y-%m-%d'),
+                        unmatched.map_batches(self._infer_dates_polars, return_dtype=pl.Utf8, is_elementwise=True),
+                    ]).alias(col))
+            
+            # Rendered by format_numbers, like the pandas path
+            numeric_cols = [col for col in self.NUMERIC_COLUMNS if col in renames.values()]
+            numeric_exprs = [
+                pl.col(col).str.replace_all(",", "", literal=True).cast(pl.Float64, strict=False)
+                .map_batches(self._format_numbers_polars, return_dtype=pl.Utf8, is_elementwise=True)
+                .alias(col)
+                for col in numeric_cols
+            ]
+            
+            lf.with_columns(date_exprs + numeric_exprs).sink_csv(output_path)
+            
+            # Count nulls like validate_data does on the pandas result, where
+            # only numeric columns hold nulls and text fields are empty strings
+            output = pl.scan_csv(output_path, infer_schema_length=0)
+            exprs = [pl.len().alias('rows')] + [pl.col(col).null_count() for col in numeric_cols]
+            if len(numeric_cols) == len(renames):
+                exprs.append(pl.all_horizontal(pl.col(numeric_cols).is_null()).sum().alias('empty_rows'))
+            counts = output.select(exprs).collect().row(0, named=True)
+        except pl.exceptions.PolarsError as e:
+            # e.g. a non-UTF-8 byte past the sample used for encoding detection
+            logger.warning(f"Polars failed on {input_path}, falling back to pandas: {e}")
+            Path(output_path).unlink(missing_ok=True)
+            return None
+        
+        rows_written = counts['rows']
+        if not rows_written:
+            Path(output_path).unlink(missing_ok=True)
+            return 0
+        
+        null_counts = pd.Series({col: counts.get(col, 0) for col in renames.values()}, dtype='int64')
+        validation = self._validation_results(rows_written, counts.get('empty_rows', 0), null_counts)
+        logger.info(f"Validation results: {validation}")
+        
+        return rows_written
+    
+    def _infer_dates_polars(self, values: 'pl.Series') -> 'pl.Series':
+        """
+        Apply infer_dates to a batch of Polars strings, skipping nulls.
+        
+        Args:
+            values: Date strings, null where no inference is needed
+            
+        Returns:
+            YYYY-MM-DD strings, null where parsing fails
+        """
+        strings = pd.Series(values.to_list(), dtype=object)
+        todo = strings.notna()
+        out = pd.Series(None, index=strings.index, dtype=object)
+        if todo.any():
+            out[todo] = self.infer_dates(strings[todo]).dt.strftime('%Y-%m-%d')
+        return pl.Series(values.name, out.where(out.notna(), None).tolist(), dtype=pl.Utf8)
+    
+    def _format_numbers_polars(self, values: 'pl.Series') -> 'pl.Series':
+        """
+        Apply format_numbers to a batch of Polars floats.
+        
+        Args:
+            values: Float64 values, null where missing
+            
+        Returns:
+            Formatted numbers, null for missing values, NaN and inf
+        """
+        out = self.format_numbers(values.fill_null(float('nan')).to_numpy())
+        return pl.Series(values.name, out.tolist(), dtype=pl.Utf8)
+    
+    def _clean_csv_chunked(self, input_path: Union[str, Path], output_path: Union[str, Path]) -> int:
+        """
+        Stream a CSV file through the cleaning pipeline one chunk at a time.
+        
+        Decoding errors only surface while chunks are read, so the whole
+        file is streamed again with the next encoding when one occurs.
+        
+        Args:
+            input_path: Path to input CSV file
+            output_path: Path to output cleaned CSV file
+            
+        Returns:
+            Number of rows written
+            
+        Raises:
+            Exception: If all encoding attempts fail
+        """
+        try:
+            for encoding in self.encoding_candidates(self.detect_encoding(input_path)):
+                try:
+                    logger.info(f"Attempting to stream {input_path} with encoding: {encoding}")
+                    return self._stream_csv(input_path, output_path, encoding)
+                except UnicodeDecodeError:
+                    logger.warning(f"Failed to stream with {encoding}, trying next encoding")
+                    continue
+            
+            raise Exception(f"Failed to read {input_path} with any encoding")
+        except Exception:
+            # Don't leave a partially written file behind
+            Path(output_path).unlink(missing_ok=True)
+            raise
+    
+    def _stream_csv(self, input_path: Union[str, Path], output_path: Union[str, Path], encoding: str) -> int:
+        """
+        Clean and write a CSV file chunk by chunk with a fixed encoding.
+        
+        Unknown columns are reported once, from the first chunk, and the
+        validation counts of all chunks are logged together for the file.
+        
+        Args:
+            input_path: Path to input CSV file
+            output_path: Path to output cleaned CSV file
+            encoding: Encoding to read the file with
+            
+        Returns:
+            Number of rows written
+        """
+        # The pyarrow engine cannot stream chunks, so this uses the C engine
+        reader = pd.read_csv(input_path, dtype=str, encoding=encoding, na_filter=False,
+                             chunksize=self.chunk_size)
+        rows_written = 0
+        empty_rows = 0
+        null_counts = None
+        date_formats = self.rank_file_date_formats(input_path, encoding)
+        
+        with reader:
+            for chunk in reader:
+                if chunk.empty:
+                    continue
+                
+                # Every chunk has the header's columns, so check them once
+                chunk = self.clean_dataframe(chunk, date_formats, warn_unknown=rows_written == 0)
+                
+                nulls = chunk.isnull()
+                empty_rows += nulls.all(axis=1).sum()
+                chunk_nulls = nulls.sum()
+                null_counts = chunk_nulls if null_counts is None else null_counts.add(chunk_nulls, fill_value=0)
+                
+                # The first chunk creates the file and writes the header
+                self.write_csv(chunk, output_path, append=rows_written > 0)
+                rows_written += len(chunk)
+        
+        if rows_written:
+            validation = self._validation_results(rows_written, empty_rows, null_counts)
+            logger.info(f"Validation results: {validation}")
+        
+        return rows_written
+    
+    def _merge_stats(self, stats: Dict[str, Union[int, List[str]]]) -> None:
+        """
+        Fold the statistics of another cleaner run into this cleaner's stats.
+        
+        Args:
+            stats: Statistics dictionary returned by a worker
+        """
+        self.stats['files_processed'] += stats['files_processed']
+        self.stats['rows_processed'] += stats['rows_processed']
+        self.stats['errors'].extend(stats['errors'])
+    
     def clean_directory(self, input_dir: Union[str, Path], output_dir: Union[str, Path], 
-                       file_pattern: str = "*.csv") -> Dict[str, int]:
+                       file_pattern: Union[str, Sequence[str]] = FILE_PATTERNS,
+                       max_workers: Optional[int] = None) -> Dict[str, int]:
         """
-        Clean all CSV files in a directory.
+        Clean all CSV and Excel files in a directory.
+        
+        Files are independent, so they are cleaned in parallel worker
+        processes and their statistics merged as each one finishes.
         
         Args:
-            input_dir: Directory containing input CSV files
+            input_dir: Directory containing input CSV or Excel files
             output_dir: Directory for output cleaned CSV files
-            file_pattern: File pattern to match (default: "*.csv")
+            file_pattern: File pattern or patterns to match (default: FILE_PATTERNS)
+            max_workers: Number of worker processes (default: one per CPU core)
             
         Returns:
             Dictionary with processing statistics
@@ -411,38 +1094,132 @@ class CSVCleaner:
         # Create output directory
         output_path.mkdir(parents=True, exist_ok=True)
         
-        # Find all CSV files
-        csv_files = list(input_path.glob(file_pattern))
+        # Find all matching files
+        patterns = [file_pattern] if isinstance(file_pattern, str) else file_pattern
+        csv_files = sorted({
+            f for pattern in patterns for f in input_path.glob(pattern)
+            if not f.name.startswith('~$')  # Excel lock files
+        })
         
         if not csv_files:
-            logger.warning(f"No CSV files found in {input_dir}")
+            logger.warning(f"No CSV or Excel files found in {input_dir}")
             return self.stats
         
-        logger.info(f"Found {len(csv_files)} CSV files to process")
+        logger.info(f"Found {len(csv_files)} files to process")
+        
+        max_workers = min(max_workers or os.cpu_count() or 1, len(csv_files))
         
-        # Process each file
-        for csv_file in csv_files:
-            output_file = output_path / f"cleaned_{csv_file.name}"
-            self.clean_csv(csv_file, output_file)
+        if max_workers == 1:
+            for csv_file in csv_files:
+                output_file = output_path / f"cleaned_{csv_file.stem}.csv"
+                self.clean_csv(csv_file, output_file)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(_clean_file, type(self), self.chunk_size,
+                                    str(csv_file), str(output_path / f"cleaned_{csv_file.stem}.csv")): csv_file
+                    for csv_file in csv_files
+                }
+                for future in as_completed(futures):
+                    try:
+                        self._merge_stats(future.result())
+                    except Exception as e:
+                        # e.g. BrokenProcessPool when a worker is killed
+                        error_msg = f"Failed to clean {futures[future]}: {str(e)}"
+                        logger.error(error_msg)
+                        self.stats['errors'].append(error_msg)
         
         # Log final stats
         logger.info(f"Processing complete. Stats: {self.stats}")
         return self.stats
 
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _read_digits(row, start, count):
+        value = 0
+        for k in range(start, start + count):
+            digit = row[k] - 48
+            if digit < 0 or digit > 9:
+                return -1
+            value = value * 10 + digit
+        return value
+
+    @njit(parallel=True, cache=True)
+    def _parse_fixed_width_dates(rows, y_pos, m_pos, d_pos, sep1, sep2, sep,
+                                 min_year, max_year, out):
+        """
+        Parse rows of 10 ASCII bytes into days since the Unix epoch.
+        
+        Rows that do not match the layout, are not valid calendar dates or
+        have a year outside min_year..max_year get the NaT sentinel.
+        """
+        nat = np.iinfo(np.int64).min
+        for i in prange(rows.shape[0]):
+            row = rows[i]
+            out[i] = nat
+            if row[sep1] != sep or row[sep2] != sep:
+                continue
+            
+            y = _read_digits(row, y_pos, 4)
+            m = _read_digits(row, m_pos, 2)
+            d = _read_digits(row, d_pos, 2)
+            if y < min_year or y > max_year or m < 1 or m > 12 or d < 1:
+                continue
+            
+            if m == 2:
+                leap = (y % 4 == 0 and y % 100 != 0) or y % 400 == 0
+                month_days = 29 if leap else 28
+            elif m == 4 or m == 6 or m == 9 or m == 11:
+                month_days = 30
+            else:
+                month_days = 31
+            if d > month_days:
+                continue
+            
+            # Days from civil date, counting years from March
+            if m <= 2:
+                y -= 1
+            era = y // 400
+            yoe = y - era * 400
+            doy = (153 * (m + (-3 if m > 2 else 9)) + 2) // 5 + d - 1
+            doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+            out[i] = era * 146097 + doe - 719468
+
+
+def _clean_file(cleaner_cls: type, chunk_size: Optional[int],
+                input_path: str, output_path: str) -> Dict[str, Union[int, List[str]]]:
+    """
+    Clean a single file in a worker process.
+    
+    Args:
+        cleaner_cls: CSVCleaner class (or subclass) to instantiate
+        chunk_size: Chunk size passed to the cleaner
+        input_path: Path to input CSV file
+        output_path: Path to output cleaned CSV file
+        
+    Returns:
+        Statistics of the worker's cleaner
+    """
+    cleaner = cleaner_cls(chunk_size=chunk_size)
+    cleaner.clean_csv(input_path, output_path)
+    return cleaner.stats
+
+
 def main():
     """
     Main function for command-line usage.
     """
     # Configuration
     script_dir = Path(__file__).parent
-    input_folder = script_dir / 'csv'
+    # Workbooks saved by run_macro_and_convert_csv.py
+    input_folder = script_dir / 'cleaned'
     output_folder = script_dir / 'cleaned_csv'
     
     # Initialize cleaner
     cleaner = CSVCleaner(chunk_size=None)  # Set chunk_size for large files
     
-    # Process all CSV files
+    # Process all CSV and Excel files
     stats = cleaner.clean_directory(input_folder, output_folder)
     
     # Print summary
@@ -1,57 +1,53 @@
 import os
 import win32com.client
-import time
 
 RAW_DIR = r"C:\Users\duke.cha\Desktop\all_gi\raw"
 CLEANED_DIR = r"C:\Users\duke.cha\Desktop\all_gi\cleaned"
-CSV_DIR = r"C:\Users\duke.cha\Desktop\all_gi\csv"
 MACRO_NAME = "PERSONAL.XLSB!savelograw"
 
 # Ensure output directories exist
 os.makedirs(CLEANED_DIR, exist_ok=True)
-os.makedirs(CSV_DIR, exist_ok=True)
 
 PERSONAL_XLSB_PATH = r"C:\\Users\\duke.cha\\AppData\\Roaming\\Microsoft\\Excel\\XLSTART\\PERSONAL.XLSB"
 
-def run_macro_on_files():
-    excel = win32com.client.Dispatch("Excel.Application")
-    excel.Visible = False
-    excel.DisplayAlerts = False  # Suppress Excel pop-ups and alerts
+EXCEL_EXTENSIONS = (".xls", ".xlsx", ".xlsm")
+XL_CALCULATION_MANUAL = -4135
+XL_CALCULATION_AUTOMATIC = -4105
+
+def run_macro_on_files(excel):
+    # Open PERSONAL.XLSB so macros are available
+    personal_wb = excel.Workbooks.Open(PERSONAL_XLSB_PATH)
+    # Recalculating after every macro edit is wasted work during the batch
+    excel.Calculation = XL_CALCULATION_MANUAL
+    # Workbooks saved by the macro are still recalculated on save, so the
+    # cleaned files read by csv_cleaning.py hold current values
+    excel.CalculateBeforeSave = True
     try:
-        # Open PERSONAL.XLSB so macros are available
-        personal_wb = excel.Workbooks.Open(PERSONAL_XLSB_PATH)
         for filename in os.listdir(RAW_DIR):
-            if filename.lower().endswith((".xls", ".xlsx", ".xlsm")):
+            if filename.lower().endswith(EXCEL_EXTENSIONS):
                 raw_path = os.path.join(RAW_DIR, filename)
                 wb = excel.Workbooks.Open(raw_path)
-                # Run the macro
+                # Application.Run blocks until the macro has finished
                 excel.Application.Run(MACRO_NAME)
                 wb.Close(SaveChanges=True)
-                # Give Excel a moment to finish writing files
-                time.sleep(1)
-        personal_wb.Close(SaveChanges=False)
     finally:
-        excel.Quit()
+        # Don't leave Excel in manual calculation mode for the user
+        excel.Calculation = XL_CALCULATION_AUTOMATIC
+        personal_wb.Close(SaveChanges=False)
 
-def convert_cleaned_to_csv():
+def process_files():
+    # The cleaned workbooks are read directly by csv_cleaning.py (calamine),
+    # so no CSV export round-trip through Excel is needed
     excel = win32com.client.Dispatch("Excel.Application")
     excel.Visible = False
+    excel.DisplayAlerts = False  # Suppress Excel pop-ups and alerts
+    excel.ScreenUpdating = False
     try:
-        for filename in os.listdir(CLEANED_DIR):
-            if filename.lower().endswith((".xls", ".xlsx", ".xlsm")):
-                cleaned_path = os.path.join(CLEANED_DIR, filename)
-                wb = excel.Workbooks.Open(cleaned_path)
-                # Save as CSV
-                base = os.path.splitext(filename)[0]
-                csv_path = os.path.join(CSV_DIR, base + ".csv")
-                wb.SaveAs(csv_path, FileFormat=6)  # 6 = xlCSV
-                wb.Close(False)
+        print("Running macro on raw files...")
+        run_macro_on_files(excel)
     finally:
         excel.Quit()
 
 if __name__ == "__main__":
-    print("Running macro on raw files...")
-    run_macro_on_files()
-    print("Converting cleaned files to CSV...")
-    convert_cleaned_to_csv()
+    process_files()
     print("Done.")